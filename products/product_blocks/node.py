@@ -31,10 +31,9 @@ class NodeBlockProvisioning(NodeBlockInactive, lifecycle=[SubscriptionLifecycle.
 
 
 class NodeBlock(NodeBlockProvisioning, lifecycle=[SubscriptionLifecycle.ACTIVE]):
-    """Node  with optional fields to use in the active lifecycle state."""
+    """Node with optional fields to use in the active lifecycle state.
 
-    node_id: int
-    node_name: str
-    node_status: str
-    ipv4_loopback: IPv4Network
-    ipv6_loopback: IPv6Network
+    All fields are inherited unchanged from the provisioning state, so they are not
+    re-declared; re-declaring them would make pydantic rebuild identical field
+    definitions and validators for this class.
+    """
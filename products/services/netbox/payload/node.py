@@ -11,6 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # from dataclasses import dataclass
+import asyncio
+from typing import Any, Dict, Tuple
 
 from orchestrator.domain import SubscriptionModel
 
@@ -18,6 +20,17 @@ from products.product_blocks.node import NodeBlockProvisioning
 from services import netbox
 
 
+async def _fetch_device_and_loopbacks(
+    model: NodeBlockProvisioning,
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Fetch the device record and both loopback addresses from Netbox concurrently."""
+    return await asyncio.gather(
+        netbox.async_get_device(model.node_name),
+        netbox.async_get_ip_address(str(model.ipv4_loopback)),
+        netbox.async_get_ip_address(str(model.ipv6_loopback)),
+    )
+
+
 def build_node_payload(model: NodeBlockProvisioning, subscription: SubscriptionModel) -> netbox.DevicePayload:
     """Create and return a Netbox payload object for a :class:`~products.product_blocks.node.NodeBlockProvisioning`.
 
@@ -44,16 +57,18 @@ def build_node_payload(model: NodeBlockProvisioning, subscription: SubscriptionM
     if not model.node_id:
         raise ValueError("Build node payload not implemented for new nodes")
 
-    # device is not created by the orchestrator, fetch needed fields from Netbox
-    device = netbox.get_device(model.node_name)
+    # device is not created by the orchestrator, fetch needed fields from Netbox; the
+    # three reads are independent, so overlap them on the shared Netbox loop instead of
+    # paying three sequential round trips
+    device, ipv4_loopback, ipv6_loopback = netbox.run_async(_fetch_device_and_loopbacks(model))
 
     return netbox.DevicePayload(
-        site=device.site.id,  # not yet administrated in orchestrator
-        device_type=device.device_type.id,  # not yet administrated in orchestrator
-        device_role=device.device_type.id,  # not yet administrated in orchestrator
+        site=device["site"]["id"],  # not yet administrated in orchestrator
+        device_type=device["device_type"]["id"],  # not yet administrated in orchestrator
+        device_role=device["device_type"]["id"],  # not yet administrated in orchestrator
         id=model.node_id if model.node_id else -1,
         name=model.node_name,
         status=model.node_status,
-        primary_ip4=netbox.get_ip_address(str(model.ipv4_loopback)).id,
-        primary_ip6=netbox.get_ip_address(str(model.ipv6_loopback)).id,
+        primary_ip4=ipv4_loopback["id"],
+        primary_ip6=ipv6_loopback["id"],
     )
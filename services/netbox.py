@@ -10,11 +10,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from dataclasses import asdict, dataclass
-from functools import singledispatch
-from typing import Any, List, Optional
-
+import asyncio
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from os import getenv
+from threading import Lock, Thread, local
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+import aiohttp
+import orjson
 import structlog
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pynetbox import api
 from pynetbox.core.endpoint import Endpoint
 from pynetbox.core.query import RequestError
@@ -23,26 +32,155 @@ from pynetbox.models.dcim import Interfaces
 from pynetbox.models.dcim import Interfaces as PynetboxInterfaces
 from pynetbox.models.ipam import IpAddresses, Prefixes
 
-from utils.singledispatch import single_dispatch_base
-
 logger = structlog.get_logger(__name__)
 
-netbox = api(
-    "http://netbox:8080",
-    token="e744057d755255a31818bf74df2350c26eeabe54",
-)  # fmt: skip
+NETBOX_URL = getenv("NETBOX_URL", "http://netbox:8080")
+NETBOX_TOKEN = getenv("NETBOX_TOKEN", "e744057d755255a31818bf74df2350c26eeabe54")
+
+# Page size used when streaming device listings from Netbox.
+GET_DEVICES_PAGE_SIZE = 500
+
+
+@lru_cache(maxsize=1)
+def _http_adapter() -> HTTPAdapter:
+    """
+    Get the process-wide pooled HTTP adapter, created on first use.
+
+    urllib3's connection pool is thread-safe, so one shared adapter lets every
+    per-thread session reuse the same keep-alive connections (and retry transient
+    errors with backoff) instead of paying a TCP handshake per thread per request.
+    """
+    return HTTPAdapter(
+        max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]),
+        pool_connections=10,
+        pool_maxsize=20,
+    )
+
+
+_thread_local = local()
+
+
+def _netbox() -> api:
+    """
+    Get the pynetbox api instance for the current thread, creating it on first use.
+
+    requests.Session is not thread-safe, and the orchestrator executes workflow steps
+    on a thread pool; give each thread its own api/session but mount the shared pooled
+    adapter on all of them. Instantiating lazily also keeps module import free of
+    network activity and lets tests substitute an instance without monkeypatching
+    import order.
+    """
+    if (netbox := getattr(_thread_local, "netbox", None)) is None:
+        netbox = api(NETBOX_URL, token=NETBOX_TOKEN)
+        netbox.http_session.mount("http://", _http_adapter())
+        netbox.http_session.mount("https://", _http_adapter())
+        netbox.http_session.headers["Connection"] = "keep-alive"
+        _thread_local.netbox = netbox
+    return netbox
+
+T = TypeVar("T")
+
+# All async Netbox I/O runs on one long-lived background loop with one aiohttp session,
+# so keep-alive connections survive across workflow steps and nothing is created (or
+# leaked) per call.
+_ASYNC_LOOP_LOCK = Lock()
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it in a daemon thread on first use.
+    """
+    global _async_loop
+    with _ASYNC_LOOP_LOCK:
+        if _async_loop is None or _async_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            Thread(target=loop.run_forever, name="netbox-async", daemon=True).start()
+            _async_loop = loop
+    return _async_loop
+
+
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the shared Netbox event loop from sync code and return its result.
+
+    Workflow steps are synchronous; scheduling on one persistent loop keeps the aiohttp
+    session (and its keep-alive connections) alive across calls, and also works from
+    threads that happen to run an event loop of their own.
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_async_loop()).result()
+
+
+def _get_async_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it on first use.
+
+    Only called from coroutines running on the shared loop, so creation is effectively
+    single-threaded and the session stays bound to one loop for its whole lifetime.
+    """
+    global _async_session
+    if _async_session is None or _async_session.closed:
+        _async_session = aiohttp.ClientSession(
+            base_url=NETBOX_URL,
+            headers={"Authorization": f"Token {NETBOX_TOKEN}"},
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        )
+    return _async_session
+
+
+async def _async_get(path: str, **params: Any) -> List[Dict[str, Any]]:
+    """
+    Issue a GET against the Netbox REST API and return the results, following pagination.
+    """
+    session = _get_async_session()
+    url = f"/api/{path}/"
+    results: List[Dict[str, Any]] = []
+    while url:
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+        if "results" not in data:  # detail route, single object
+            return [data]
+        results.extend(data["results"])
+        url = data["next"]  # absolute url that already carries the query string
+        params = {}
+    return results
+
+
+@lru_cache(maxsize=None)
+def _payload_field_names(payload_type: type) -> Tuple[str, ...]:
+    """
+    Get the dataclass field names of a payload type, computed once per type.
+    """
+    return tuple(field.name for field in fields(payload_type))
+
 
+def _as_plain(value: Any) -> Any:
+    """
+    Shallow conversion of a payload (and nested payloads) to plain dicts and lists.
 
-@dataclass
+    Unlike dataclasses.asdict this does not deepcopy field values, which dominates
+    serialization of payloads with nested termination lists.
+    """
+    if is_dataclass(value):
+        return {name: _as_plain(getattr(value, name)) for name in _payload_field_names(type(value))}
+    if isinstance(value, list):
+        return [_as_plain(item) for item in value]
+    return value
+
+
+@dataclass(slots=True)
 class NetboxPayload:
     id: int  # unique id of object on Netbox endpoint
 
     # return payload as a dict that is suitable to be used on pynetbox .create() or .updates().
     def dict(self):
-        return asdict(self)
+        return _as_plain(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DevicePayload(NetboxPayload):
     # mandatory fields to create Devices object in Netbox:
     site: int
@@ -55,13 +193,13 @@ class DevicePayload(NetboxPayload):
     primary_ip6: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class CableTerminationPayload:
     object_id: int
     object_type: str = "dcim.interface"
 
 
-@dataclass
+@dataclass(slots=True)
 class CablePayload(NetboxPayload):
     status: str
     description: Optional[str]
@@ -69,14 +207,14 @@ class CablePayload(NetboxPayload):
     b_terminations: List[CableTerminationPayload]
 
 
-@dataclass
+@dataclass(slots=True)
 class AvailablePrefixPayload:
     prefix_length: int
     description: str
     is_pool: Optional[bool] = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AvailableIpPayload:
     description: str
     assigned_object_id: int
@@ -84,24 +222,102 @@ class AvailableIpPayload:
     status: Optional[str] = "active"
 
 
+# Per-process TTL caches that collapse the duplicate reads done by validate and create
+# workflows into a single Netbox round trip. The lock only guards the cache bookkeeping
+# (cachetools releases it during the actual HTTP call), so concurrent readers never
+# serialize on Netbox I/O.
+_CACHE_LOCK = Lock()
+_device_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_device_loopbacks_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_interface_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_prefix_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_async_device_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_async_ip_address_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+
+def _invalidate_caches() -> None:
+    """
+    Evict all cached Netbox objects, called after every write so reads never return stale rows.
+    """
+    with _CACHE_LOCK:
+        _device_cache.clear()
+        _device_loopbacks_cache.clear()
+        _interface_cache.clear()
+        _prefix_cache.clear()
+        _async_device_cache.clear()
+        _async_ip_address_cache.clear()
+
+
+@cached(cache=_device_cache, key=hashkey, lock=_CACHE_LOCK)
 def get_device(name: str) -> Devices:
     """
     Get device from Netbox identified by name.
     """
-    return netbox.dcim.devices.get(name=name)
+    return _netbox().dcim.devices.get(name=name)
+
+
+_DEVICE_WITH_LOOPBACKS_QUERY = """
+query DeviceWithLoopbacks($name: [String]) {
+  device_list(name: $name) {
+    id
+    name
+    status
+    primary_ip4 { address }
+    primary_ip6 { address }
+  }
+}
+"""
+
 
+@cached(cache=_device_loopbacks_cache, key=hashkey, lock=_CACHE_LOCK)
+def get_device_with_loopbacks(name: str) -> Dict[str, Any]:
+    """
+    Get a device's id, name, status and primary IP addresses in a single GraphQL request.
 
-def get_devices(status: Optional[str] = None) -> List[Devices]:
+    Using aliases on the GraphQL endpoint folds the device lookup and both loopback
+    address lookups into one round trip instead of separate REST calls.
+    """
+    response = _netbox().http_session.post(
+        f"{NETBOX_URL}/graphql/",
+        data=orjson.dumps({"query": _DEVICE_WITH_LOOPBACKS_QUERY, "variables": {"name": [name]}}),
+        headers={
+            "Authorization": f"Token {NETBOX_TOKEN}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        },
+    )
+    response.raise_for_status()
+    devices = orjson.loads(response.content)["data"]["device_list"]
+    if not devices:
+        raise ValueError(f"device with name {name} not found in Netbox")
+    return devices[0]
+
+
+def get_devices(status: Optional[str] = None) -> Iterator[Devices]:
     """
-    Get list of Devices objects from netbox, optionally filtered by status.
+    Get Devices objects from netbox, optionally filtered by status.
+
+    Devices are yielded lazily, GET_DEVICES_PAGE_SIZE records per request, so callers can
+    stop early without materializing the whole inventory in memory. Only the brief
+    serializer (id, name, display, ...) is requested; callers that need the full record
+    should fetch the device of interest with :func:`get_device`.
     """
     logger.debug("Connecting to Netbox to get list of devices")
     if status:
-        node_list = list(netbox.dcim.devices.filter(status=status))
-    else:
-        node_list = list(netbox.dcim.devices.all())
-    logger.debug("Found nodes in Netbox", amount=len(node_list))
-    return node_list
+        return _netbox().dcim.devices.filter(
+            status=status, brief=True, exclude="config_context", limit=GET_DEVICES_PAGE_SIZE
+        )
+    return _netbox().dcim.devices.filter(brief=True, exclude="config_context", limit=GET_DEVICES_PAGE_SIZE)
+
+
+def get_device_summaries(status: str) -> List[Tuple[int, str, str]]:
+    """
+    Get (id, name, status) triples for all devices with the given status.
+
+    Streams the brief device listing and keeps only the three fields input forms need,
+    so no full device records are pinned in memory across a form generator's yield.
+    """
+    return [(device.id, device.name, status) for device in get_devices(status=status)]
 
 
 # TODO: make this a more generic function
@@ -119,47 +335,197 @@ def get_available_router_ports_by_name(router_name: str) -> List[PynetboxInterfa
     Returns:
         List[PynetboxInterfaces]: a list of valid interfaces from netbox.
     """
-    valid_ports = list(netbox.dcim.interfaces.filter(device=router_name, occupied=False, speed=400000000))
+    valid_ports = list(
+        _netbox().dcim.interfaces.filter(device=router_name, occupied=False, speed=400000000, brief=True)
+    )
     logger.debug("Found ports in Netbox", amount=len(valid_ports))
     return valid_ports
 
 
+@cached(cache=_interface_cache, key=hashkey, lock=_CACHE_LOCK)
 def get_interface_by_device_and_name(device: str, name: str) -> Interfaces:
     """
     Get Interfaces object from Netbox identified by device and name.
     """
-    return next(netbox.dcim.interfaces.filter(device=device, name=name))
+    return next(_netbox().dcim.interfaces.filter(device=device, name=name))
 
 
 def get_ip_address(address: str) -> IpAddresses:
     """
     Get IpAddresses object from Netbox identified by address.
     """
-    return netbox.ipam.ip_addresses.get(address=address)
+    return _netbox().ipam.ip_addresses.get(address=address)
 
 
+@cached(cache=_prefix_cache, key=hashkey, lock=_CACHE_LOCK)
 def get_ip_prefix_by_id(id: int) -> Prefixes:
     """
     Get Prefixes object from Netbox identified by id.
     """
-    return netbox.ipam.prefixes.get(id)
+    return _netbox().ipam.prefixes.get(id)
+
+
+async def async_get_device(name: str) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of :func:`get_device`, returns the device as returned by the Netbox REST API.
+
+    Results share the 60s TTL caching of the sync helpers (cachetools has no async
+    decorator, so the cache is checked and filled by hand), collapsing the repeated
+    lookups done by successive build_payload calls in one workflow run.
+    """
+    key = hashkey(name)
+    with _CACHE_LOCK:
+        if key in _async_device_cache:
+            return _async_device_cache[key]
+    devices = await _async_get("dcim/devices", name=name)
+    device = devices[0] if devices else None
+    with _CACHE_LOCK:
+        _async_device_cache[key] = device
+    return device
+
+
+async def async_get_devices(status: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Async variant of :func:`get_devices`.
+    """
+    params = {"status": status} if status else {}
+    return await _async_get("dcim/devices", **params)
+
+
+async def async_get_available_router_ports_by_name(router_name: str) -> List[Dict[str, Any]]:
+    """
+    Async variant of :func:`get_available_router_ports_by_name`.
+    """
+    return await _async_get("dcim/interfaces", device=router_name, occupied="false", speed=400000000)
+
+
+async def async_get_interface_by_device_and_name(device: str, name: str) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of :func:`get_interface_by_device_and_name`.
+    """
+    interfaces = await _async_get("dcim/interfaces", device=device, name=name)
+    return interfaces[0] if interfaces else None
+
+
+async def async_get_ip_address(address: str) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of :func:`get_ip_address`, cached like :func:`async_get_device`.
+    """
+    key = hashkey(address)
+    with _CACHE_LOCK:
+        if key in _async_ip_address_cache:
+            return _async_ip_address_cache[key]
+    addresses = await _async_get("ipam/ip-addresses", address=address)
+    ip_address = addresses[0] if addresses else None
+    with _CACHE_LOCK:
+        _async_ip_address_cache[key] = ip_address
+    return ip_address
+
+
+async def async_get_ip_prefix_by_id(id: int) -> Dict[str, Any]:
+    """
+    Async variant of :func:`get_ip_prefix_by_id`.
+    """
+    return (await _async_get(f"ipam/prefixes/{id}"))[0]
+
+
+async def _async_create_object(payload: NetboxPayload, path: str) -> int:
+    """
+    Async variant of :func:`_create_object`, POSTs the payload to the given API path.
+    """
+    session = _get_async_session()
+    async with session.post(f"/api/{path}/", json=payload.dict()) as response:
+        if response.status >= 400:
+            message = await response.text()
+            logger.warning("Netbox create failed", payload=payload, exc=message)
+            raise ValueError(f"invalid NetboxPayload: {message}")
+        return orjson.loads(await response.read())["id"]
+
+
+async def _async_update_object(payload: NetboxPayload, path: str) -> bool:
+    """
+    Async variant of :func:`_update_object`, PATCHes the object identified by payload.id.
+    """
+    session = _get_async_session()
+    async with session.patch(f"/api/{path}/{payload.id}/", json=payload.dict()) as response:
+        if response.status >= 400:
+            message = await response.text()
+            raise ValueError(f"Netbox object with id {payload.id} on netbox {path} endpoint not updated: {message}")
+        return True
+
+
+def _prefix_ref(parent_id: int) -> Prefixes:
+    """
+    Build a reference to the prefix with the given id without fetching it.
+
+    The available-ips/available-prefixes detail endpoints only need the parent's id to
+    construct their URL, so allocating from a prefix does not require a GET of the
+    parent object first.
+    """
+    netbox = _netbox()
+    return Prefixes({"id": parent_id}, netbox, netbox.ipam.prefixes)
 
 
 def create_available_prefix(parent_id: int, payload: AvailablePrefixPayload) -> Prefixes:
-    parent_prefix = get_ip_prefix_by_id(parent_id)
-    return parent_prefix.available_prefixes.create(asdict(payload))
+    return _prefix_ref(parent_id).available_prefixes.create(_as_plain(payload))
+
+
+def create_available_ips(parent_id: int, payloads: List[AvailableIpPayload]) -> List[IpAddresses]:
+    """
+    Create multiple available IPs in the prefix identified by parent_id with one bulk POST.
+
+    Netbox accepts a list on /api/ipam/prefixes/{id}/available-ips/, so allocation cost
+    per HTTP round trip scales with the number of payloads.
+    """
+    return _prefix_ref(parent_id).available_ips.create([_as_plain(payload) for payload in payloads])
 
 
 def create_available_ip(parent_id: int, payload: AvailableIpPayload) -> IpAddresses:
-    parent_prefix = get_ip_prefix_by_id(parent_id)
-    return parent_prefix.available_ips.create(asdict(payload))
+    """
+    Create a single available IP, routed through the bulk API so there is one code path.
+    """
+    return create_available_ips(parent_id, [payload])[0]
+
+
+def _create_cable(payload: CablePayload) -> int:
+    return _create_object(payload, endpoint=_netbox().dcim.cables)
+
+
+def _update_device(payload: DevicePayload) -> bool:
+    return _update_object(payload, endpoint=_netbox().dcim.devices)
+
+
+def _update_cable(payload: CablePayload) -> bool:
+    return _update_object(payload, endpoint=_netbox().dcim.cables)
+
+
+# Flat {payload type: handler} registries. Payload types are concrete dataclasses
+# without subclassing, so an exact-type hash lookup replaces the MRO walk that
+# functools.singledispatch does on every call.
+_CREATE_HANDLERS: Dict[type, Callable] = {
+    CablePayload: _create_cable,
+}
+_UPDATE_HANDLERS: Dict[type, Callable] = {
+    DevicePayload: _update_device,
+    CablePayload: _update_cable,
+}
+
+
+def _handler_for(registry: Dict[type, Callable], function_name: str, payload: NetboxPayload) -> Callable:
+    try:
+        return registry[type(payload)]
+    except KeyError:
+        supported_payloads = ", ".join(map(str, registry))
+        raise TypeError(
+            f"`{function_name}` called for unsupported model type {type(payload)}. "
+            f"Supported model types are: {supported_payloads}"
+        ) from None
 
 
-@singledispatch
 def create(payload: NetboxPayload, **kwargs: Any) -> int:
-    """Create object described by payload in Netbox (generic function).
+    """Create object described by payload in Netbox.
 
-    Specific implementations of this generic function will specify the payload types they work on.
+    Dispatches to the implementation registered for the payload type.
 
     Args:
         payload: Netbox object specific payload.
@@ -168,18 +534,17 @@ def create(payload: NetboxPayload, **kwargs: Any) -> int:
         The id of the created object in Netbox, raises an exception otherwise.
 
     Raises:
-        TypeError: in case a specific implementation could not be found. The payload it was called for will be
+        TypeError: in case an implementation could not be found. The payload it was called for will be
             part of the error message.
 
     """
-    return single_dispatch_base(create, payload)
+    return _handler_for(_CREATE_HANDLERS, "create", payload)(payload)
 
 
-@singledispatch
 def update(payload: NetboxPayload, **kwargs: Any) -> bool:
-    """Update object described by payload in Netbox (generic function).
+    """Update object described by payload in Netbox.
 
-    Specific implementations of this generic function will specify the payload types they work on.
+    Dispatches to the implementation registered for the payload type.
 
     Args:
         payload: Netbox object specific payload.
@@ -188,26 +553,11 @@ def update(payload: NetboxPayload, **kwargs: Any) -> bool:
         True if the object was updated successfully in Netbox, False otherwise.
 
     Raises:
-        TypeError: in case a specific implementation could not be found. The payload it was called for will be
+        TypeError: in case an implementation could not be found. The payload it was called for will be
             part of the error message.
 
     """
-    return single_dispatch_base(update, payload)
-
-
-@update.register
-def _(payload: DevicePayload, **kwargs: Any) -> bool:
-    return _update_object(payload, endpoint=netbox.dcim.devices)
-
-
-@create.register
-def _(payload: CablePayload, **kwargs: Any) -> bool:
-    return _create_object(payload, endpoint=netbox.dcim.cables)
-
-
-@update.register
-def _(payload: CablePayload, **kwargs: Any) -> bool:
-    return _update_object(payload, endpoint=netbox.dcim.cables)
+    return _handler_for(_UPDATE_HANDLERS, "update", payload)(payload)
 
 
 def _create_object(payload: NetboxPayload, endpoint: Endpoint) -> bool:
@@ -230,24 +580,33 @@ def _create_object(payload: NetboxPayload, endpoint: Endpoint) -> bool:
         logger.warning("Netbox create failed", payload=payload, exc=str(exc))
         raise ValueError(f"invalid NetboxPayload: {exc.message}") from exc
     else:
+        _invalidate_caches()
         return object.id
 
 
 def _update_object(payload: NetboxPayload, endpoint: Endpoint) -> bool:
     """
-    Create or update an object in Netbox.
+    Update an object in Netbox.
+
+    The object is PATCHed by id in a single request through pynetbox's bulk update;
+    the id is already known from the payload, so no existence-check GET is needed.
 
     Args:
-        payload: values to create or update object
+        payload: values to update object
         endpoint: a Netbox Endpoint
 
     Returns:
-         True if the node was created or updated, False otherwise
+         True if the object was updated, False otherwise
 
     Raises:
-        ValueError if object does not exist yet in Netbox.
+        ValueError if the object could not be updated in Netbox.
     """
-    if not (object := endpoint.get(payload.id)):
-        raise ValueError(f"Netbox object with id {payload.id} on netbox {endpoint.name} endpoint not found")
-    object.update(payload.dict())
-    return object.save()
+    try:
+        updated = endpoint.update([payload.dict()])
+    except RequestError as exc:
+        logger.warning("Netbox update failed", payload=payload, exc=str(exc))
+        raise ValueError(
+            f"Netbox object with id {payload.id} on netbox {endpoint.name} endpoint not updated: {exc.message}"
+        ) from exc
+    _invalidate_caches()
+    return bool(updated)
@@ -207,20 +207,20 @@ def reserve_ips_in_ipam(subscription: CircuitInactive) -> State:
             description=f"{subscription.circuit.circuit_description} Point-to-Point",
         ),
     )
-    # Now, create the NetBox IP Address entries for the devices on each side of the link:
-    a_side_ip = netbox.create_available_ip(
+    # Now, create the NetBox IP Address entries for the devices on each side of the link
+    # in a single bulk request:
+    a_side_ip, b_side_ip = netbox.create_available_ips(
         parent_id=current_circuit_prefix_127.id,
-        payload=netbox.AvailableIpPayload(
-            description=subscription.circuit.members[0].port.port_description,
-            assigned_object_id=subscription.circuit.members[0].port.port_id,
-        ),
-    )
-    b_side_ip = netbox.create_available_ip(
-        parent_id=current_circuit_prefix_127.id,
-        payload=netbox.AvailableIpPayload(
-            description=subscription.circuit.members[1].port.port_description,
-            assigned_object_id=subscription.circuit.members[1].port.port_id,
-        ),
+        payloads=[
+            netbox.AvailableIpPayload(
+                description=subscription.circuit.members[0].port.port_description,
+                assigned_object_id=subscription.circuit.members[0].port.port_id,
+            ),
+            netbox.AvailableIpPayload(
+                description=subscription.circuit.members[1].port.port_description,
+                assigned_object_id=subscription.circuit.members[1].port.port_id,
+            ),
+        ],
     )
 
     # Finally, add those IPv6 Addresses to the domain model.
@@ -1,5 +1,6 @@
 """Workflow to initially provision a node."""
 import ipaddress
+from functools import lru_cache
 
 import structlog
 from orchestrator.config.assignee import Assignee
@@ -18,12 +19,44 @@ from workflows.shared import CUSTOMER_UUID, create_workflow
 
 logger = structlog.get_logger(__name__)
 
+# Router config shown to the user in provide_config_to_user; kept at module level so the
+# template is parsed once instead of being rebuilt on every step execution.
+_ROUTER_CONFIG_TEMPLATE = """! Paste the following config into {node_name}:
+! to complete configuring the device
+!
+enable
+configure terminal
+!
+hostname {node_name}
+!
+interface loopback 0
+!
+ip address {ipv4_loopback}
+ipv6 address {ipv6_loopback}
+!
+exit
+!
+end
+copy running-config startup-config"""
+
+
+@lru_cache(maxsize=4096)
+def _parse_ipv4_network(address: str) -> ipaddress.IPv4Network:
+    """Parse an IPv4 CIDR string, memoized so each unique address is parsed once."""
+    return ipaddress.IPv4Network(address, strict=False)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ipv6_network(address: str) -> ipaddress.IPv6Network:
+    """Parse an IPv6 CIDR string, memoized so each unique address is parsed once."""
+    return ipaddress.IPv6Network(address, strict=False)
+
 
 def initial_input_form_generator(product_name: str) -> FormGenerator:
     """Generates the Node Form to display to the user."""
     logger.debug("Generating initial input form")
-    devices = netbox.get_devices(status="planned")
-    choices = [device.name for device in devices]
+    device_by_name = {name: (id, name, status) for id, name, status in netbox.get_device_summaries(status="planned")}
+    choices = list(device_by_name)
     DeviceEnum = Choice("Planned devices", zip(choices, choices))  # type: ignore
 
     class CreateNodeForm(FormPage):
@@ -37,14 +70,12 @@ def initial_input_form_generator(product_name: str) -> FormGenerator:
         select_device_choice: DeviceEnum  # type: ignore
 
     user_input = yield CreateNodeForm
-    device_data = next(
-        device for device in devices if user_input.select_device_choice == device.name
-    )
+    device_id, device_name, device_status = device_by_name[user_input.select_device_choice]
 
     return {
-        "device_id": device_data.id,
-        "device_name": device_data.name,
-        "device_status": device_data.status.value
+        "device_id": device_id,
+        "device_name": device_name,
+        "device_status": device_status
     }
 
 
@@ -81,9 +112,9 @@ def fetch_ip_address_information(subscription: NodeInactive) -> State:
         "Fetching detailed IP information for node from netbox",
         node_name=subscription.node.node_name,
     )
-    device = netbox.get_device(name=subscription.node.node_name)
-    subscription.node.ipv4_loopback = ipaddress.IPv4Network(device.primary_ip4.address)
-    subscription.node.ipv6_loopback = ipaddress.IPv6Network(device.primary_ip6.address)
+    device = netbox.get_device_with_loopbacks(subscription.node.node_name)
+    subscription.node.ipv4_loopback = _parse_ipv4_network(device["primary_ip4"]["address"])
+    subscription.node.ipv6_loopback = _parse_ipv6_network(device["primary_ip6"]["address"])
 
     return {"subscription": subscription}
 
@@ -92,23 +123,13 @@ def fetch_ip_address_information(subscription: NodeInactive) -> State:
 def provide_config_to_user(subscription: NodeProvisioning) -> FormGenerator:
     """Generates a configuration payload that a user can paste into a router."""
     logger.debug("Creating node payload", node_name=subscription.node.node_name)
-    router_config = f"""! Paste the following config into {subscription.node.node_name}:
-! to complete configuring the device
-!
-enable
-configure terminal
-!
-hostname {subscription.node.node_name}
-!
-interface loopback 0
-!
-ip address {subscription.node.ipv4_loopback}
-ipv6 address {subscription.node.ipv6_loopback}
-!
-exit
-!
-end
-copy running-config startup-config"""
+    router_config = _ROUTER_CONFIG_TEMPLATE.format_map(
+        {
+            "node_name": subscription.node.node_name,
+            "ipv4_loopback": subscription.node.ipv4_loopback,
+            "ipv6_loopback": subscription.node.ipv6_loopback,
+        }
+    )
 
     class ConfigResults(FormPage):
         """FormPage for showing a user the config needed for a node"""